@@ -1,7 +1,11 @@
+import collections.abc
 import datetime
+import functools
+import math
 import re
 import six
-import time
+import sys
+import weakref
 
 from google.cloud.ndb import context as context_module
 from google.cloud.ndb import exceptions
@@ -11,6 +15,39 @@ from google.cloud.ndb import model
 from google.cloud.ndb import _datastore_query
 
 
+_PARSE_CACHE_SIZE = 256
+_SMALL_FILTER_MAP_SIZE = 8
+
+_CONDITIONS = frozenset(("<=", ">=", "!=", "=", "<", ">", "IS", "IN"))
+_CAST_OPERATORS = frozenset(("GEOPT", "USER", "KEY", "DATE", "TIME", "DATETIME"))
+_FLOAT_WORDS = frozenset(("NAN", "INF", "INFINITY"))
+_ORDER_DIRECTIONS = {"ASC": _datastore_query.UP, "DESC": _datastore_query.DOWN}
+
+_ERR_UNEXPECTED_SYMBOL = "Unexpected Symbol: %s"
+_ERR_EXTRA_SYMBOLS = "Expected no additional symbols"
+_ERR_WHERE_IDENTIFIER = "Invalid WHERE Identifier"
+_ERR_WHERE_CONDITION = "Invalid WHERE Condition"
+_ERR_MULTIPLE_ANCESTORS = 'Only one ANCESTOR IS" clause allowed'
+_ERR_ANCESTOR_WITHOUT_IS = '"IS" expected to follow "ANCESTOR"'
+_ERR_IS_WITHOUT_ANCESTOR = '"IS" can only be used when comparing against "ANCESTOR"'
+_ERR_LIST_WITHOUT_IN = "Only IN can process a list of values"
+_ERR_RESERVED_IDENTIFIER = "Identifier is a reserved keyword"
+_ERR_IDENTIFIER_EXPECTED = "Identifier Expected"
+_ERR_ORDER_BY_PROPERTY = "Invalid ORDER BY Property"
+_ERR_BAD_LIMIT = "Bad Limit in LIMIT Value"
+_ERR_NON_NUMBER_LIMIT = "Non-number limit in LIMIT clause"
+_ERR_OFFSET_IN_LIMIT = "Offset already defined in LIMIT clause"
+_ERR_NON_NUMBER_OFFSET = "Non-number offset in OFFSET clause"
+_ERR_UNKNOWN_HINT = "Unknown HINT"
+
+_RE_QUOTED_STRING = re.compile(r"((?:\'[^\'\n\r]*\')+)")
+_RE_ORDINAL = re.compile(r":(\d+)$")
+_RE_NAMED = re.compile(r":(\w+)$")
+_RE_IDENTIFIER = re.compile(r"(\w+(?:\.\w+)*)$")
+_RE_QUOTED_IDENTIFIER = re.compile(r'((?:"[^"\s]+")+)$')
+_RE_NUMBER = re.compile(r"(\d+)$")
+
+
 class GQL(object):
     """A GQL parser for NDB queries.
 
@@ -108,12 +145,61 @@ class GQL(object):
 
         self._auth_domain = _auth_domain
 
-        self._symbols = self.TOKENIZE_REGEX.findall(query_string)
-        self._InitializeParseState()
-        try:
-            self._Select()
-        except exceptions.BadQueryError as error:
-            raise error
+        # Surrounding whitespace doesn't change the parse, so strip it before
+        # the cache lookup to let such variants share a cache entry.
+        self.__dict__.update(self._Parse(query_string.strip()))
+        # The parsed orderings are shared, so each instance gets its own list.
+        # orderings() returns it and get_query() builds its sort orders from
+        # it, so changes made through orderings() carry into the query.
+        self._orderings = list(self._orderings)
+
+    @classmethod
+    @functools.lru_cache(maxsize=_PARSE_CACHE_SIZE)
+    def _Parse(cls, query_string):
+        """Parse a query string, caching the result.
+
+        The parsed state only depends on the query string, so it is shared
+        between all instances created from the same string. To keep sharing
+        safe, the returned filters and orderings are read-only.
+
+        Args:
+            query_string (str): properly formatted GQL query string.
+
+        Returns:
+            Dict[str, Any]: The parsed state, keyed by attribute name.
+
+        Raises:
+            exceptions.BadQueryError: if the query is not parsable.
+        """
+        parser = cls.__new__(cls)
+        parser._symbols = cls.TOKENIZE_REGEX.findall(query_string)
+        # Keywords are case insensitive, so fold each symbol once up front
+        # rather than on every keyword probe.
+        parser._upper_symbols = [symbol.upper() for symbol in parser._symbols]
+        parser._InitializeParseState()
+        parser._Select()
+
+        return {
+            "_kind": parser._kind,
+            "_keys_only": parser._keys_only,
+            "_projection": parser._projection,
+            "_distinct": parser._distinct,
+            "_has_ancestor": parser._has_ancestor,
+            "_offset": parser._offset,
+            "_limit": parser._limit,
+            "_hint": parser._hint,
+            "_filters": _SmallFilterMap(
+                (
+                    filter_rule,
+                    tuple(
+                        (operator, tuple(parameters)) for operator, parameters in values
+                    ),
+                )
+                for filter_rule, values in parser._filters.items()
+            ),
+            "_orderings": tuple(parser._orderings),
+            "_query_options": parser._QueryOptions(),
+        }
 
     def _InitializeParseState(self):
 
@@ -132,7 +218,13 @@ class GQL(object):
         self._next_symbol = 0
 
     def filters(self):
-        """Return the compiled list of filters."""
+        """Return the compiled filters.
+
+        Returns:
+            Mapping[Tuple[Union[str, int], str], Tuple[Tuple[str, tuple], ...]]:
+                A read-only mapping of ``(property, condition)`` to a tuple of
+                ``(operator, parameters)`` pairs.
+        """
         return self._filters
 
     def hint(self):
@@ -179,17 +271,6 @@ class GQL(object):
         """Deprecated. Old way to refer to `kind`."""
         return self._kind
 
-    _result_type_regex = re.compile(r"(\*|__key__)")
-    _quoted_string_regex = re.compile(r"((?:\'[^\'\n\r]*\')+)")
-    _ordinal_regex = re.compile(r":(\d+)$")
-    _named_regex = re.compile(r":(\w+)$")
-    _identifier_regex = re.compile(r"(\w+(?:\.\w+)*)$")
-
-    _quoted_identifier_regex = re.compile(r'((?:"[^"\s]+")+)$')
-    _conditions_regex = re.compile(r"(<=|>=|!=|=|<|>|is|in)$", re.IGNORECASE)
-    _number_regex = re.compile(r"(\d+)$")
-    _cast_regex = re.compile(r"(geopt|user|key|date|time|datetime)$", re.IGNORECASE)
-
     def _Error(self, error_message):
         """Generic query error.
 
@@ -212,8 +293,8 @@ class GQL(object):
 
     def _Accept(self, symbol_string):
         """Advance the symbol and return true if the next symbol matches input."""
-        if self._next_symbol < len(self._symbols):
-            if self._symbols[self._next_symbol].upper() == symbol_string:
+        if self._next_symbol < len(self._upper_symbols):
+            if self._upper_symbols[self._next_symbol] == symbol_string:
                 self._next_symbol += 1
                 return True
         return False
@@ -229,7 +310,7 @@ class GQL(object):
                 in.
         """
         if not self._Accept(symbol_string):
-            self._Error("Unexpected Symbol: %s" % symbol_string)
+            self._Error(_ERR_UNEXPECTED_SYMBOL % symbol_string)
 
     def _AcceptRegex(self, regex):
         """Advance and return the symbol if the next symbol matches the regex.
@@ -253,6 +334,53 @@ class GQL(object):
 
         return None
 
+    def _AcceptKeyword(self, keywords):
+        """Advance and return the symbol if it is one of the given keywords.
+
+        Args:
+            keywords (Container[str]): container of upper case keywords to
+                accept.
+
+        Returns:
+            The symbol as it appears in the query string, or None if the next
+                symbol isn't one of the keywords.
+        """
+        if self._next_symbol < len(self._upper_symbols):
+            if self._upper_symbols[self._next_symbol] in keywords:
+                self._next_symbol += 1
+                return self._symbols[self._next_symbol - 1]
+
+        return None
+
+    def _PeekStartsWith(self, prefix):
+        """Return True if the next symbol starts with the given prefix.
+
+        Used to skip regular expression probes that can't possibly match the
+        next symbol.
+
+        Args:
+            prefix (str): the prefix to check for.
+        """
+        if self._next_symbol < len(self._symbols):
+            return self._symbols[self._next_symbol].startswith(prefix)
+        return False
+
+    def _PeekNumber(self):
+        """Return True if the next symbol could be converted to a number.
+
+        Checked before trying int() and float() on a symbol, so that strings,
+        keywords and casts don't raise and swallow a ValueError every time
+        they pass through the literal parser.
+        """
+        if self._next_symbol < len(self._symbols):
+            first = self._symbols[self._next_symbol][0]
+            return (
+                first.isdigit()
+                or first in "+-."
+                or self._upper_symbols[self._next_symbol] in _FLOAT_WORDS
+            )
+        return False
+
     def _AcceptTerminal(self):
         """Accept either a single semi-colon or an empty string.
 
@@ -266,7 +394,7 @@ class GQL(object):
         self._Accept(";")
 
         if self._next_symbol < len(self._symbols):
-            self._Error("Expected no additional symbols")
+            self._Error(_ERR_EXTRA_SYMBOLS)
         return True
 
     def _Select(self):
@@ -320,11 +448,11 @@ class GQL(object):
         """Consume the filter list (remainder of the WHERE clause)."""
         identifier = self._Identifier()
         if not identifier:
-            self._Error("Invalid WHERE Identifier")
+            self._Error(_ERR_WHERE_IDENTIFIER)
 
-        condition = self._AcceptRegex(self._conditions_regex)
+        condition = self._AcceptKeyword(_CONDITIONS)
         if not condition:
-            self._Error("Invalid WHERE Condition")
+            self._Error(_ERR_WHERE_CONDITION)
         self._CheckFilterSyntax(identifier, condition)
 
         if not self._AddSimpleFilter(identifier, condition, self._Reference()):
@@ -335,7 +463,7 @@ class GQL(object):
                 if not type_cast or not self._AddProcessedParameterFilter(
                     identifier, condition, *type_cast
                 ):
-                    self._Error("Invalid WHERE Condition")
+                    self._Error(_ERR_WHERE_CONDITION)
 
         if self._Accept("AND"):
             return self._FilterList()
@@ -373,15 +501,16 @@ class GQL(object):
             identifier (str): identifier being used in comparison.
             condition (str): comparison operator used in the filter.
         """
+        is_condition = condition.upper() == "IS"
         if identifier.lower() == "ancestor":
-            if condition.lower() == "is":
+            if is_condition:
 
                 if self._has_ancestor:
-                    self._Error('Only one ANCESTOR IS" clause allowed')
+                    self._Error(_ERR_MULTIPLE_ANCESTORS)
             else:
-                self._Error('"IS" expected to follow "ANCESTOR"')
-        elif condition.lower() == "is":
-            self._Error('"IS" can only be used when comparing against "ANCESTOR"')
+                self._Error(_ERR_ANCESTOR_WITHOUT_IS)
+        elif is_condition:
+            self._Error(_ERR_IS_WITHOUT_ANCESTOR)
 
     def _AddProcessedParameterFilter(self, identifier, condition, operator, parameters):
         """Add a filter with post-processing required.
@@ -410,7 +539,7 @@ class GQL(object):
             assert condition.lower() == "is"
 
         if operator == "list" and condition.lower() != "in":
-            self._Error("Only IN can process a list of values")
+            self._Error(_ERR_LIST_WITHOUT_IN)
 
         self._filters.setdefault(filter_rule, []).append((operator, parameters))
         return True
@@ -438,21 +567,27 @@ class GQL(object):
             str: The identifier string. If quoted, the surrounding quotes are
                 stripped.
         """
-        identifier = self._AcceptRegex(self._identifier_regex)
+        identifier = self._AcceptRegex(_RE_IDENTIFIER)
         if identifier:
-            if identifier.upper() in self.RESERVED_KEYWORDS:
+            # The identifier regex matches whole symbols, so the folded copy
+            # of the accepted symbol is the upper-cased identifier.
+            if self._upper_symbols[self._next_symbol - 1] in self.RESERVED_KEYWORDS:
                 self._next_symbol -= 1
-                self._Error("Identifier is a reserved keyword")
-        else:
-            identifier = self._AcceptRegex(self._quoted_identifier_regex)
+                self._Error(_ERR_RESERVED_IDENTIFIER)
+        elif self._PeekStartsWith('"'):
+            identifier = self._AcceptRegex(_RE_QUOTED_IDENTIFIER)
             if identifier:
                 identifier = identifier[1:-1].replace('""', '"')
+        if identifier:
+            # Property and kind names recur across queries; interning them
+            # lets every parsed query share a single copy of each name.
+            identifier = sys.intern(identifier)
         return identifier
 
     def _ExpectIdentifier(self):
         id = self._Identifier()
         if not id:
-            self._Error("Identifier Expected")
+            self._Error(_ERR_IDENTIFIER_EXPECTED)
         return id
 
     def _Reference(self):
@@ -466,11 +601,14 @@ class GQL(object):
                 parameters or string for named parameters) to a bind-time
                 parameter.
         """
-        reference = self._AcceptRegex(self._ordinal_regex)
+        if not self._PeekStartsWith(":"):
+            return None
+
+        reference = self._AcceptRegex(_RE_ORDINAL)
         if reference:
             return int(reference)
         else:
-            reference = self._AcceptRegex(self._named_regex)
+            reference = self._AcceptRegex(_RE_NAMED)
             if reference:
                 return reference
 
@@ -486,7 +624,7 @@ class GQL(object):
 
         literal = None
 
-        if self._next_symbol < len(self._symbols):
+        if self._PeekNumber():
             try:
                 literal = int(self._symbols[self._next_symbol])
             except ValueError:
@@ -502,9 +640,9 @@ class GQL(object):
                 else:
                     self._next_symbol += 1
 
-        if literal is None:
+        if literal is None and self._PeekStartsWith("'"):
 
-            literal = self._AcceptRegex(self._quoted_string_regex)
+            literal = self._AcceptRegex(_RE_QUOTED_STRING)
             if literal:
                 literal = literal[1:-1].replace("''", "'")
 
@@ -516,10 +654,10 @@ class GQL(object):
                 literal = False
 
         if literal is not None:
-            return Literal(literal)
+            return _intern_literal(literal)
 
         if self._Accept("NULL"):
-            return Literal(None)
+            return _intern_literal(None)
         else:
             return None
 
@@ -540,7 +678,7 @@ class GQL(object):
                 Returns :data:None if there is no TypeCast function or list is
                 not allowed to be cast.
         """
-        cast_op = self._AcceptRegex(self._cast_regex)
+        cast_op = self._AcceptKeyword(_CAST_OPERATORS)
         if not cast_op:
             if can_cast_list and self._Accept("("):
 
@@ -567,14 +705,14 @@ class GQL(object):
         """Consume variables and sort order for ORDER BY clause."""
         identifier = self._Identifier()
         if identifier:
-            if self._Accept("DESC"):
-                self._orderings.append((identifier, _datastore_query.DOWN))
-            elif self._Accept("ASC"):
-                self._orderings.append((identifier, _datastore_query.UP))
+            if self._AcceptKeyword(_ORDER_DIRECTIONS):
+                order = self._upper_symbols[self._next_symbol - 1]
+                direction = _ORDER_DIRECTIONS[order]
             else:
-                self._orderings.append((identifier, _datastore_query.UP))
+                direction = _datastore_query.UP
+            self._orderings.append((identifier, direction))
         else:
-            self._Error("Invalid ORDER BY Property")
+            self._Error(_ERR_ORDER_BY_PROPERTY)
 
         if self._Accept(","):
             return self._OrderList()
@@ -584,19 +722,19 @@ class GQL(object):
         """Consume the LIMIT clause."""
         if self._Accept("LIMIT"):
 
-            maybe_limit = self._AcceptRegex(self._number_regex)
+            maybe_limit = self._AcceptRegex(_RE_NUMBER)
 
             if maybe_limit:
 
                 if self._Accept(","):
                     self._offset = int(maybe_limit)
-                    maybe_limit = self._AcceptRegex(self._number_regex)
+                    maybe_limit = self._AcceptRegex(_RE_NUMBER)
 
                 self._limit = int(maybe_limit)
                 if self._limit < 1:
-                    self._Error("Bad Limit in LIMIT Value")
+                    self._Error(_ERR_BAD_LIMIT)
             else:
-                self._Error("Non-number limit in LIMIT clause")
+                self._Error(_ERR_NON_NUMBER_LIMIT)
 
         return self._Offset()
 
@@ -604,12 +742,12 @@ class GQL(object):
         """Consume the OFFSET clause."""
         if self._Accept("OFFSET"):
             if self._offset != -1:
-                self._Error("Offset already defined in LIMIT clause")
-            offset = self._AcceptRegex(self._number_regex)
+                self._Error(_ERR_OFFSET_IN_LIMIT)
+            offset = self._AcceptRegex(_RE_NUMBER)
             if offset:
                 self._offset = int(offset)
             else:
-                self._Error("Non-number offset in OFFSET clause")
+                self._Error(_ERR_NON_NUMBER_OFFSET)
         return self._Hint()
 
     def _Hint(self):
@@ -633,9 +771,28 @@ class GQL(object):
             elif self._Accept("ANCESTOR_FIRST"):
                 self._hint = "ANCESTOR_FIRST"
             else:
-                self._Error("Unknown HINT")
+                self._Error(_ERR_UNKNOWN_HINT)
         return self._AcceptTerminal()
 
+    def _QueryOptions(self):
+        """Compute the Query arguments that only depend on the query string.
+
+        These are worked out once per parse so that :meth:`get_query` only
+        has to resolve the model class and build the filters and sort orders.
+
+        Returns:
+            Dict[str, Any]: Keyword arguments for the Query constructor.
+        """
+        return {
+            "ancestor": None,
+            "default_options": None,
+            "projection": self._projection,
+            "distinct_on": self._projection if self._distinct else None,
+            "limit": self._limit if self._limit >= 0 else None,
+            "offset": self.offset(),
+            "keys_only": self._keys_only or None,
+        }
+
     def _args_to_val(self, func, args):
         """Helper for GQL parsing to extract values from GQL expressions.
 
@@ -669,8 +826,8 @@ class GQL(object):
             name, op = name_op
             values = gql_filters[name_op]
             op = op.lower()
+            prop = model_class._properties.get(name)
             for (func, args) in values:
-                prop = model_class._properties.get(name)
                 val = self._args_to_val(func, args)
                 if isinstance(val, query_module.ParameterizedThing):
                     node = query_module.ParameterNode(prop, op, val)
@@ -698,53 +855,78 @@ class GQL(object):
         else:
             model_class = model.Model._lookup_model(kind)
             kind = model_class._get_kind()
-        ancestor = None
         model_filters = list(model_class._default_filters())
         filters = self.query_filters(model_class, model_filters)
-        default_options = None
-        offset = self.offset()
-        limit = self.limit()
-        if limit < 0:
-            limit = None
-        keys_only = self.is_keys_only()
-        if not keys_only:
-            keys_only = None
-        projection = self.projection()
-        project = self._app
-        namespace = self._namespace
-        if self.is_distinct():
-            distinct_on = projection
-        else:
-            distinct_on = None
-        order_by = []
-        for order in self.orderings():
-            order_str, direction = order
-            if direction == 2:
-                order_str = "-{}".format(order_str)
-            order_by.append(order_str)
+        order_by = [
+            "-{}".format(name) if direction == _datastore_query.DOWN else name
+            for name, direction in self.orderings()
+        ]
         return query_module.Query(
             kind=kind,
-            ancestor=ancestor,
             filters=filters,
             order_by=order_by,
-            project=project,
-            namespace=namespace,
-            default_options=default_options,
-            projection=projection,
-            distinct_on=distinct_on,
-            limit=limit,
-            offset=offset,
-            keys_only=keys_only,
+            project=self._app,
+            namespace=self._namespace,
+            **self._query_options,
         )
 
 
+class _SmallFilterMap(collections.abc.Mapping):
+    """Read-only mapping for the filters of a parsed query.
+
+    Most queries only have a handful of filters, so up to
+    ``_SMALL_FILTER_MAP_SIZE`` entries are kept in a pair of tuples and found
+    by a linear scan, which is lighter than a dict at that size. Larger maps
+    fall back to a dict.
+
+    Args:
+        items (Iterable[Tuple[Any, Any]]): The ``(key, value)`` pairs.
+    """
+
+    __slots__ = ("_keys", "_vals", "_fallback")
+
+    def __init__(self, items):
+        items = tuple(items)
+        if len(items) > _SMALL_FILTER_MAP_SIZE:
+            self._keys = self._vals = ()
+            self._fallback = dict(items)
+        else:
+            self._keys = tuple(key for key, _ in items)
+            self._vals = tuple(value for _, value in items)
+            self._fallback = None
+
+    def __getitem__(self, key):
+        if self._fallback is not None:
+            return self._fallback[key]
+        for index, candidate in enumerate(self._keys):
+            if candidate == key:
+                return self._vals[index]
+        raise KeyError(key)
+
+    def __iter__(self):
+        if self._fallback is not None:
+            return iter(self._fallback)
+        return iter(self._keys)
+
+    def __len__(self):
+        if self._fallback is not None:
+            return len(self._fallback)
+        return len(self._keys)
+
+    def __repr__(self):
+        return "{}({!r})".format(type(self).__name__, list(self.items()))
+
+
 class Literal(object):
     """Class for representing literal values differently than unbound params.
     This is a simple wrapper class around basic types and datastore types.
     """
 
+    __slots__ = ("_value", "_hash", "__weakref__")
+
     def __init__(self, value):
         self._value = value
+        self._hash = hash(value)
 
     def Get(self):
         """Return the value of the literal."""
@@ -752,14 +934,43 @@ class Literal(object):
 
     def __eq__(self, other):
         """A literal is equal to another if their values are the same"""
-        if not isinstance(other, Literal):
+        if type(other) is not Literal:
             return NotImplemented
-        return self.Get() == other.Get()
+        return self._value == other._value
+
+    def __hash__(self):
+        return self._hash
 
     def __repr__(self):
         return "Literal(%s)" % repr(self._value)
 
 
+_LITERALS = weakref.WeakValueDictionary()
+
+
+def _intern_literal(value):
+    """Get a Literal for the value, shared with any other live parsed query.
+
+    Literals are immutable, so queries that compare against the same constant
+    can share one instance. The type is part of the key so that, for example,
+    ``1``, ``1.0`` and ``True`` remain distinct literals, and so is the sign of
+    floats so that ``0.0`` and ``-0.0`` do.
+
+    Args:
+        value (Union[str, int, float, bool, None]): The literal value.
+
+    Returns:
+        Literal: The shared literal.
+    """
+    intern_key = (type(value), value)
+    if isinstance(value, float):
+        intern_key += (math.copysign(1.0, value),)
+    literal = _LITERALS.get(intern_key)
+    if literal is None:
+        literal = _LITERALS[intern_key] = Literal(value)
+    return literal
+
+
 def _raise_not_implemented(func):
     def raise_inner(value):
         raise NotImplementedError("GQL function {} is not implemented".format(func))
@@ -771,74 +982,63 @@ def _raise_cast_error(message):
     raise exceptions.BadQueryError("GQL function error: {}".format(message))
 
 
+_TIME_FORMAT = "%H:%M:%S"
+_DATE_FORMAT = "%Y-%m-%d"
+_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def _parse_datetime(value, fmt, function_name, values):
+    """Parse the single string argument of a date or time function."""
+    try:
+        return datetime.datetime.strptime(value, fmt)
+    except ValueError as error:
+        _raise_cast_error(
+            "Error during {} conversion, {}, {}".format(function_name, error, values)
+        )
+
+
+def _build_datetime(constructor, function_name, values):
+    """Build a date or time value from the numeric arguments of a function."""
+    try:
+        return constructor(*values)
+    except ValueError as error:
+        _raise_cast_error(
+            "Error during {} conversion, {}, {}".format(function_name, error, values)
+        )
+
+
 def _time_function(values):
     if len(values) == 1:
         value = values[0]
         if isinstance(value, six.string_types):
-            try:
-                time_tuple = time.strptime(value, "%H:%M:%S")
-            except ValueError as error:
-                _raise_cast_error(
-                    "Error during time conversion, {}, {}".format(error, values)
-                )
-            time_tuple = time_tuple[3:]
-            time_tuple = time_tuple[0:3]
-        elif isinstance(value, six.integer_types):
-            time_tuple = (value,)
-        else:
+            return _parse_datetime(value, _TIME_FORMAT, "time", values).time()
+        if not isinstance(value, six.integer_types):
             _raise_cast_error("Invalid argument for time(), {}".format(value))
-    elif len(values) < 4:
-        time_tuple = tuple(values)
-    else:
+    elif len(values) > 3:
         _raise_cast_error("Too many arguments for time(), {}".format(values))
-    try:
-        return datetime.time(*time_tuple)
-    except ValueError as error:
-        _raise_cast_error("Error during time conversion, {}, {}".format(error, values))
+    return _build_datetime(datetime.time, "time", values)
 
 
 def _date_function(values):
     if len(values) == 1:
         value = values[0]
         if isinstance(value, six.string_types):
-            try:
-                time_tuple = time.strptime(value, "%Y-%m-%d")[0:6]
-            except ValueError as error:
-                _raise_cast_error(
-                    "Error during date conversion, {}, {}".format(error, values)
-                )
-        else:
-            _raise_cast_error("Invalid argument for date(), {}".format(value))
-    elif len(values) == 3:
-        time_tuple = (values[0], values[1], values[2], 0, 0, 0)
-    else:
+            return _parse_datetime(value, _DATE_FORMAT, "date", values)
+        _raise_cast_error("Invalid argument for date(), {}".format(value))
+    elif len(values) != 3:
         _raise_cast_error("Too many arguments for date(), {}".format(values))
-    try:
-        return datetime.datetime(*time_tuple)
-    except ValueError as error:
-        _raise_cast_error("Error during date conversion, {}, {}".format(error, values))
+    return _build_datetime(datetime.datetime, "date", values)
 
 
 def _datetime_function(values):
     if len(values) == 1:
         value = values[0]
         if isinstance(value, six.string_types):
-            try:
-                time_tuple = time.strptime(value, "%Y-%m-%d %H:%M:%S")[0:6]
-            except ValueError as error:
-                _raise_cast_error(
-                    "Error during date conversion, {}, {}".format(error, values)
-                )
-        else:
-            _raise_cast_error("Invalid argument for datetime(), {}".format(value))
-    else:
-        time_tuple = values
-    try:
-        return datetime.datetime(*time_tuple)
-    except ValueError as error:
-        _raise_cast_error(
-            "Error during datetime conversion, {}, {}".format(error, values)
-        )
+            # Parse errors for DATETIME() strings have always been reported as
+            # date conversion errors.
+            return _parse_datetime(value, _DATETIME_FORMAT, "date", values)
+        _raise_cast_error("Invalid argument for datetime(), {}".format(value))
+    return _build_datetime(datetime.datetime, "datetime", values)
 
 
 def _geopt_function(values):
@@ -23,6 +23,7 @@ import os
 from google.cloud import environment_vars
 from google.cloud.ndb import context as context_module
 from google.cloud.ndb import _eventloop
+from google.cloud.ndb import _gql
 from google.cloud.ndb import global_cache as global_cache_module
 from google.cloud.ndb import model
 from google.cloud.ndb import utils
@@ -51,9 +52,13 @@ def reset_state(environ):
 
     - ``model.Property._FIND_METHODS_CACHE``
     - ``model.Model._kind_map``
+    - ``_gql.GQL._Parse`` (parse cache)
+    - ``_gql._LITERALS``
     """
     yield
     model.Property._FIND_METHODS_CACHE.clear()
+    _gql.GQL._Parse.cache_clear()
+    _gql._LITERALS.clear()
     model.Model._kind_map.clear()
     global_cache_module._InProcessGlobalCache.cache.clear()
 
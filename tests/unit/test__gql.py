@@ -28,11 +28,66 @@ GQL_QUERY = """
 """
 
 
+@pytest.fixture(scope="module")
+def gql_default():
+    """``GQL_QUERY``, parsed once for tests that only inspect the result."""
+    return gql_module.GQL(GQL_QUERY)
+
+
+@pytest.fixture(scope="module")
+def gql_namespaced():
+    """``GQL_QUERY`` parsed with a namespace, shared like ``gql_default``."""
+    return gql_module.GQL(GQL_QUERY, namespace="test-namespace")
+
+
+@pytest.fixture(scope="module")
+def some_kinds():
+    """Variants of the ``SomeKind`` model, keyed by the type of their properties.
+
+    Building the model classes once per module saves re-running the model
+    metaclass for every test. The classes are only registered in
+    ``Model._kind_map`` by the ``some_kind`` fixture, since ``reset_state``
+    clears it after each test.
+    """
+
+    def some_kind(*property_types):
+        properties = {
+            "prop{}".format(i): property_type()
+            for i, property_type in enumerate(property_types, start=1)
+        }
+        return type("SomeKind", (model.Model,), properties)
+
+    return {
+        "mixed": some_kind(
+            model.StringProperty,
+            model.StringProperty,
+            model.IntegerProperty,
+            model.IntegerProperty,
+        ),
+        "string": some_kind(model.StringProperty),
+        "integer": some_kind(model.IntegerProperty),
+        "date": some_kind(model.DateProperty),
+        "datetime": some_kind(model.DateTimeProperty),
+        "time": some_kind(model.TimeProperty),
+        "geopt": some_kind(model.GeoPtProperty),
+        "key": some_kind(model.KeyProperty),
+    }
+
+
+@pytest.fixture
+def some_kind(request, some_kinds):
+    """Register and return the ``SomeKind`` variant named by the test param."""
+    kind = some_kinds[request.param]
+    model.Model._kind_map[kind._get_kind()] = kind
+    return kind
+
+
 class TestLiteral:
     @staticmethod
     def test_constructor():
         literal = gql_module.Literal("abc")
-        assert literal.__dict__ == {"_value": "abc"}
+        assert literal._value == "abc"
+        assert not hasattr(literal, "__dict__")
 
     @staticmethod
     def test_Get():
@@ -53,17 +108,105 @@ class TestLiteral:
         assert literal.__eq__(literal3) is False
         assert literal.__eq__(42) is NotImplemented
 
+    @staticmethod
+    def test___hash__():
+        literal = gql_module.Literal("abc")
+        literal2 = gql_module.Literal("abc")
+        assert hash(literal) == hash(literal2) == hash("abc")
+
+
+class Test_intern_literal:
+    @staticmethod
+    def test_shared():
+        literal = gql_module._intern_literal("abc")
+        assert literal == gql_module.Literal("abc")
+        assert gql_module._intern_literal("abc") is literal
+
+    @staticmethod
+    def test_distinct_types():
+        literal = gql_module._intern_literal(1)
+        assert gql_module._intern_literal(1.0) is not literal
+        assert gql_module._intern_literal(True) is not literal
+
+    @staticmethod
+    def test_signed_zero():
+        gql_module.GQL("SELECT * FROM SomeKind WHERE prop1 = -0.0")
+        gql = gql_module.GQL("SELECT * FROM SomeKind WHERE prop1 = 0.0")
+        ((_, (literal,)),) = gql.filters()[("prop1", "=")]
+        assert str(literal.Get()) == "0.0"
+
+
+class TestSmallFilterMap:
+    @staticmethod
+    def test_small():
+        filters = gql_module._SmallFilterMap([("a", 1), ("b", 2)])
+        assert filters._fallback is None
+        assert filters["b"] == 2
+        assert list(filters) == ["a", "b"]
+        assert len(filters) == 2
+        assert filters == {"a": 1, "b": 2}
+        with pytest.raises(KeyError):
+            filters["c"]
+
+    @staticmethod
+    def test_large():
+        items = [(str(i), i) for i in range(gql_module._SMALL_FILTER_MAP_SIZE + 1)]
+        filters = gql_module._SmallFilterMap(items)
+        assert filters._fallback == dict(items)
+        assert filters["1"] == 1
+        assert list(filters) == [key for key, _ in items]
+        assert len(filters) == len(items)
+        with pytest.raises(KeyError):
+            filters["a"]
+
+    @staticmethod
+    def test___repr__():
+        filters = gql_module._SmallFilterMap([("a", 1)])
+        assert repr(filters) == "_SmallFilterMap([('a', 1)])"
+
 
 class TestGQL:
     @staticmethod
-    def test_constructor():
+    def test_constructor(gql_default):
+        assert gql_default.kind() == "SomeKind"
+
+    @staticmethod
+    def test_constructor_with_namespace(gql_namespaced):
+        assert gql_namespaced._namespace == "test-namespace"
+
+    @staticmethod
+    def test_constructor_reuses_parsed_query():
+        gql = gql_module.GQL(GQL_QUERY)
+        gql2 = gql_module.GQL(GQL_QUERY, namespace="test-namespace")
+        assert gql.filters() is gql2.filters()
+        assert gql2._namespace == "test-namespace"
+
+    @staticmethod
+    def test_constructor_ignores_surrounding_whitespace():
         gql = gql_module.GQL(GQL_QUERY)
-        assert gql.kind() == "SomeKind"
+        gql2 = gql_module.GQL(GQL_QUERY.strip())
+        assert gql.filters() is gql2.filters()
 
     @staticmethod
-    def test_constructor_with_namespace():
-        gql = gql_module.GQL(GQL_QUERY, namespace="test-namespace")
-        assert gql._namespace == "test-namespace"
+    def test_constructor_parsed_query_read_only():
+        gql = gql_module.GQL(GQL_QUERY)
+        with pytest.raises(TypeError):
+            gql.filters()[("prop5", "=")] = []
+        gql.orderings().append(("prop5", 1))
+        gql2 = gql_module.GQL(GQL_QUERY)
+        assert gql2.orderings() == [("prop4", 1), ("prop1", 2)]
+
+    @staticmethod
+    def test_constructor_shares_names_and_literals():
+        gql = gql_module.GQL("SELECT * FROM SomeKind WHERE prop1=5")
+        gql2 = gql_module.GQL("SELECT * FROM SomeKind WHERE prop1=5 LIMIT 1")
+        assert gql.kind() is gql2.kind()
+        ((name, _),) = gql.filters()
+        ((name2, _),) = gql2.filters()
+        assert name is name2
+        ((_, (literal,)),) = gql.filters()[("prop1", "=")]
+        ((_, (literal2,)),) = gql2.filters()[("prop1", "=")]
+        assert literal is literal2
 
     @staticmethod
     def test_constructor_bad_query():
@@ -106,12 +249,26 @@ class TestGQL:
             gql_module.GQL("SELECT * FROM SomeKind WHERE prop1=")
 
     @staticmethod
-    def test_filters():
+    def test_constructor_bad_quoted_identifier():
+        with pytest.raises(exceptions.BadQueryError):
+            gql_module.GQL('SELECT * FROM "SomeKind')
+
+    @staticmethod
+    def test_constructor_bad_reference():
+        with pytest.raises(exceptions.BadQueryError):
+            gql_module.GQL("SELECT * FROM SomeKind WHERE prop1=:")
+
+    @staticmethod
+    def test_constructor_unterminated_string():
+        with pytest.raises(exceptions.BadQueryError):
+            gql_module.GQL("SELECT * FROM SomeKind WHERE prop1='xxx")
+
+    @staticmethod
+    def test_filters(gql_default):
         Literal = gql_module.Literal
-        gql = gql_module.GQL(GQL_QUERY)
-        assert gql.filters() == {
-            ("prop2", "="): [("nop", [Literal("xxx")])],
-            ("prop3", ">"): [("nop", [Literal(5)])],
+        assert gql_default.filters() == {
+            ("prop2", "="): (("nop", (Literal("xxx"),)),),
+            ("prop3", ">"): (("nop", (Literal(5),)),),
         }
 
     @staticmethod
@@ -125,6 +282,15 @@ class TestGQL:
         with pytest.raises(exceptions.BadQueryError):
             gql_module.GQL("SELECT * FROM SomeKind HINT TAKE_THE_HINT")
 
+    @staticmethod
+    def test_error_message():
+        with pytest.raises(exceptions.BadQueryError) as error:
+            gql_module.GQL("SELECT * FROM SomeKind HINT TAKE_THE_HINT")
+        assert str(error.value) == "Parse Error: Unknown HINT at symbol TAKE_THE_HINT"
+        with pytest.raises(exceptions.BadQueryError) as error:
+            gql_module.GQL("SELECT * FROM SomeKind ORDER")
+        assert str(error.value) == "Parse Error: Unexpected Symbol: BY at end of string"
+
     @staticmethod
     def test_limit():
         gql = gql_module.GQL("SELECT * FROM SomeKind LIMIT 10")
@@ -156,46 +322,45 @@ class TestGQL:
             gql_module.GQL("SELECT * FROM SomeKind OFFSET ZERO")
 
     @staticmethod
-    def test_orderings():
-        gql = gql_module.GQL(GQL_QUERY)
-        assert gql.orderings() == [("prop4", 1), ("prop1", 2)]
+    def test_orderings(gql_default):
+        assert gql_default.orderings() == [("prop4", 1), ("prop1", 2)]
+        assert gql_default.orderings() is gql_default.orderings()
 
     @staticmethod
-    def test_is_keys_only():
-        gql = gql_module.GQL(GQL_QUERY)
-        assert gql.is_keys_only() is False
+    def test_is_keys_only(gql_default):
+        assert gql_default.is_keys_only() is False
         gql = gql_module.GQL("SELECT __key__ from SomeKind")
         assert gql.is_keys_only() is True
 
     @staticmethod
-    def test_projection():
-        gql = gql_module.GQL(GQL_QUERY)
-        assert gql.projection() == ("prop1", "prop2")
+    def test_projection(gql_default):
+        assert gql_default.projection() == ("prop1", "prop2")
+        assert gql_default.projection() is gql_default.projection()
 
     @staticmethod
-    def test_is_distinct():
-        gql = gql_module.GQL(GQL_QUERY)
-        assert gql.is_distinct() is False
+    def test_is_distinct(gql_default):
+        assert gql_default.is_distinct() is False
         gql = gql_module.GQL("SELECT DISTINCT prop1 from SomeKind")
         assert gql.is_distinct() is True
 
     @staticmethod
-    def test_kind():
-        gql = gql_module.GQL(GQL_QUERY)
-        assert gql.kind() == "SomeKind"
-        assert gql._entity == "SomeKind"
+    def test_kind(gql_default):
+        assert gql_default.kind() == "SomeKind"
+        assert gql_default._entity == "SomeKind"
 
     @staticmethod
     def test_cast():
         gql = gql_module.GQL("SELECT * FROM SomeKind WHERE prop1=user('js')")
-        assert gql.filters() == {("prop1", "="): [("user", [gql_module.Literal("js")])]}
+        assert gql.filters() == {
+            ("prop1", "="): (("user", (gql_module.Literal("js"),)),)
+        }
 
     @staticmethod
     def test_in_list():
         Literal = gql_module.Literal
         gql = gql_module.GQL("SELECT * FROM SomeKind WHERE prop1 IN (1, 2, 3)")
         assert gql.filters() == {
-            ("prop1", "IN"): [("list", [Literal(1), Literal(2), Literal(3)])]
+            ("prop1", "IN"): (("list", (Literal(1), Literal(2), Literal(3))),)
         }
 
     @staticmethod
@@ -206,12 +371,14 @@ class TestGQL:
     @staticmethod
     def test_reference():
         gql = gql_module.GQL("SELECT * FROM SomeKind WHERE prop1=:ref")
-        assert gql.filters() == {("prop1", "="): [("nop", ["ref"])]}
+        assert gql.filters() == {("prop1", "="): (("nop", ("ref",)),)}
 
     @staticmethod
     def test_ancestor_is():
         gql = gql_module.GQL("SELECT * FROM SomeKind WHERE ANCESTOR IS 'AnyKind'")
-        assert gql.filters() == {(-1, "is"): [("nop", [gql_module.Literal("AnyKind")])]}
+        assert gql.filters() == {
+            (-1, "is"): (("nop", (gql_module.Literal("AnyKind"),)),)
+        }
 
     @staticmethod
     def test_ancestor_multiple_ancestors():
@@ -236,52 +403,81 @@ class TestGQL:
     @staticmethod
     def test_func():
         gql = gql_module.GQL("SELECT * FROM SomeKind WHERE prop1=key(:1)")
-        assert gql.filters() == {("prop1", "="): [("key", [1])]}
+        assert gql.filters() == {("prop1", "="): (("key", (1,)),)}
 
     @staticmethod
     def test_null():
         gql = gql_module.GQL("SELECT * FROM SomeKind WHERE prop1=NULL")
-        assert gql.filters() == {("prop1", "="): [("nop", [gql_module.Literal(None)])]}
+        assert gql.filters() == {
+            ("prop1", "="): (("nop", (gql_module.Literal(None),)),)
+        }
 
     @staticmethod
     def test_true():
         gql = gql_module.GQL("SELECT * FROM SomeKind WHERE prop1=TRUE")
-        assert gql.filters() == {("prop1", "="): [("nop", [gql_module.Literal(True)])]}
+        assert gql.filters() == {
+            ("prop1", "="): (("nop", (gql_module.Literal(True),)),)
+        }
 
     @staticmethod
     def test_false():
         gql = gql_module.GQL("SELECT * FROM SomeKind WHERE prop1=FALSE")
-        assert gql.filters() == {("prop1", "="): [("nop", [gql_module.Literal(False)])]}
+        assert gql.filters() == {
+            ("prop1", "="): (("nop", (gql_module.Literal(False),)),)
+        }
 
     @staticmethod
     def test_float():
         gql = gql_module.GQL("SELECT * FROM SomeKind WHERE prop1=3.14")
-        assert gql.filters() == {("prop1", "="): [("nop", [gql_module.Literal(3.14)])]}
+        assert gql.filters() == {
+            ("prop1", "="): (("nop", (gql_module.Literal(3.14),)),)
+        }
+
+    @staticmethod
+    def test_float_infinity():
+        gql = gql_module.GQL("SELECT * FROM SomeKind WHERE prop1=inf")
+        assert gql.filters() == {
+            ("prop1", "="): (("nop", (gql_module.Literal(float("inf")),)),)
+        }
+
+    @staticmethod
+    def test_not_a_number():
+        with pytest.raises(exceptions.BadQueryError):
+            gql_module.GQL("SELECT * FROM SomeKind WHERE prop1=-x")
+
+    @staticmethod
+    def test_non_ascii_string():
+        gql = gql_module.GQL("SELECT * FROM SomeKind WHERE prop1='Jos\u00e9'")
+        assert gql.filters() == {
+            ("prop1", "="): (("nop", (gql_module.Literal("Jos\u00e9"),)),)
+        }
 
     @staticmethod
     def test_quoted_identifier():
         gql = gql_module.GQL('SELECT * FROM SomeKind WHERE "prop1"=3.14')
-        assert gql.filters() == {("prop1", "="): [("nop", [gql_module.Literal(3.14)])]}
+        assert gql.filters() == {
+            ("prop1", "="): (("nop", (gql_module.Literal(3.14),)),)
+        }
 
     @staticmethod
     def test_order_by_ascending():
         gql = gql_module.GQL("SELECT * FROM SomeKind ORDER BY prop1 ASC")
         assert gql.orderings() == [("prop1", 1)]
 
+    @staticmethod
+    def test_order_by_lower_case():
+        gql = gql_module.GQL("SELECT * FROM SomeKind ORDER BY prop1 desc, prop2 asc")
+        assert gql.orderings() == [("prop1", 2), ("prop2", 1)]
+
     @staticmethod
     def test_order_by_no_arg():
         with pytest.raises(exceptions.BadQueryError):
             gql_module.GQL("SELECT * FROM SomeKind ORDER BY")
 
     @staticmethod
-    @pytest.mark.usefixtures("in_context")
-    def test_get_query():
-        class SomeKind(model.Model):
-            prop1 = model.StringProperty()
-            prop2 = model.StringProperty()
-            prop3 = model.IntegerProperty()
-            prop4 = model.IntegerProperty()
-
+    @pytest.mark.usefixtures("in_context", "some_kind")
+    @pytest.mark.parametrize("some_kind", ["mixed"], indirect=True)
+    def test_get_query(gql_namespaced):
         rep = (
             "Query(namespace='test-namespace', kind='SomeKind', filters=AND(FilterNode('prop2', '=', {}"
             "), FilterNode('prop3', '>', 5)), order_by=[PropertyOrder(name="
@@ -289,37 +485,42 @@ class TestGQL:
             "reverse=True)], limit=10, offset=5, "
             "projection=['prop1', 'prop2'])"
         )
-        gql = gql_module.GQL(GQL_QUERY, namespace="test-namespace")
-        query = gql.get_query()
+        query = gql_namespaced.get_query()
         compat_rep = "'xxx'"
         assert repr(query) == rep.format(compat_rep)
 
     @staticmethod
-    @pytest.mark.usefixtures("in_context")
-    def test_get_query_distinct():
-        class SomeKind(model.Model):
-            prop1 = model.StringProperty()
+    @pytest.mark.usefixtures("in_context", "some_kind")
+    @pytest.mark.parametrize("some_kind", ["mixed"], indirect=True)
+    def test_get_query_follows_orderings():
+        gql = gql_module.GQL("SELECT * FROM SomeKind ORDER BY prop1")
+        gql.orderings().append(("prop2", 2))
+        query = gql.get_query()
+        assert repr(query.order_by) == (
+            "[PropertyOrder(name='prop1', reverse=False), "
+            "PropertyOrder(name='prop2', reverse=True)]"
+        )
 
+    @staticmethod
+    @pytest.mark.usefixtures("in_context", "some_kind")
+    @pytest.mark.parametrize("some_kind", ["string"], indirect=True)
+    def test_get_query_distinct():
         gql = gql_module.GQL("SELECT DISTINCT prop1 FROM SomeKind")
         query = gql.get_query()
         assert query.distinct_on == ("prop1",)
 
     @staticmethod
-    @pytest.mark.usefixtures("in_context")
+    @pytest.mark.usefixtures("in_context", "some_kind")
+    @pytest.mark.parametrize("some_kind", ["string"], indirect=True)
     def test_get_query_no_kind():
-        class SomeKind(model.Model):
-            prop1 = model.StringProperty()
-
         gql = gql_module.GQL("SELECT *")
         query = gql.get_query()
         assert query.kind is None
 
     @staticmethod
-    @pytest.mark.usefixtures("in_context")
+    @pytest.mark.usefixtures("in_context", "some_kind")
+    @pytest.mark.parametrize("some_kind", ["integer"], indirect=True)
     def test_get_query_in():
-        class SomeKind(model.Model):
-            prop1 = model.IntegerProperty()
-
         gql = gql_module.GQL("SELECT prop1 FROM SomeKind WHERE prop1 IN (1, 2, 3)")
         query = gql.get_query()
         assert query.filters == query_module.OR(
@@ -329,32 +530,26 @@ class TestGQL:
         )
 
     @staticmethod
-    @pytest.mark.usefixtures("in_context")
+    @pytest.mark.usefixtures("in_context", "some_kind")
+    @pytest.mark.parametrize("some_kind", ["string"], indirect=True)
     def test_get_query_in_parameterized():
-        class SomeKind(model.Model):
-            prop1 = model.StringProperty()
-
         gql = gql_module.GQL("SELECT prop1 FROM SomeKind WHERE prop1 IN (:1, :2, :3)")
         query = gql.get_query()
         assert "'in'," in str(query.filters)
 
     @staticmethod
-    @pytest.mark.usefixtures("in_context")
+    @pytest.mark.usefixtures("in_context", "some_kind")
+    @pytest.mark.parametrize("some_kind", ["string"], indirect=True)
     def test_get_query_keys_only():
-        class SomeKind(model.Model):
-            prop1 = model.StringProperty()
-
         gql = gql_module.GQL("SELECT __key__ FROM SomeKind WHERE prop1='a'")
         query = gql.get_query()
         assert query.keys_only is True
         assert "keys_only=True" in query.__repr__()
 
     @staticmethod
-    @pytest.mark.usefixtures("in_context")
+    @pytest.mark.usefixtures("in_context", "some_kind")
+    @pytest.mark.parametrize("some_kind", ["date"], indirect=True)
     def test_get_query_date():
-        class SomeKind(model.Model):
-            prop1 = model.DateProperty()
-
         gql = gql_module.GQL(
             "SELECT prop1 FROM SomeKind WHERE prop1 = Date(2020, 3, 26)"
         )
@@ -364,11 +559,9 @@ class TestGQL:
         )
 
     @staticmethod
-    @pytest.mark.usefixtures("in_context")
+    @pytest.mark.usefixtures("in_context", "some_kind")
+    @pytest.mark.parametrize("some_kind", ["date"], indirect=True)
     def test_get_query_date_one_parameter():
-        class SomeKind(model.Model):
-            prop1 = model.DateProperty()
-
         gql = gql_module.GQL(
             "SELECT prop1 FROM SomeKind WHERE prop1 = Date('2020-03-26')"
         )
@@ -378,21 +571,17 @@ class TestGQL:
         )
 
     @staticmethod
-    @pytest.mark.usefixtures("in_context")
+    @pytest.mark.usefixtures("in_context", "some_kind")
+    @pytest.mark.parametrize("some_kind", ["date"], indirect=True)
     def test_get_query_date_parameterized():
-        class SomeKind(model.Model):
-            prop1 = model.DateProperty()
-
         gql = gql_module.GQL("SELECT prop1 FROM SomeKind WHERE prop1 = Date(:1)")
         query = gql.get_query()
         assert "'date'" in str(query.filters)
 
     @staticmethod
-    @pytest.mark.usefixtures("in_context")
+    @pytest.mark.usefixtures("in_context", "some_kind")
+    @pytest.mark.parametrize("some_kind", ["date"], indirect=True)
     def test_get_query_date_one_parameter_bad_date():
-        class SomeKind(model.Model):
-            prop1 = model.DateProperty()
-
         gql = gql_module.GQL(
             "SELECT prop1 FROM SomeKind WHERE prop1 = Date('not a date')"
         )
@@ -400,21 +589,17 @@ class TestGQL:
             gql.get_query()
 
     @staticmethod
-    @pytest.mark.usefixtures("in_context")
+    @pytest.mark.usefixtures("in_context", "some_kind")
+    @pytest.mark.parametrize("some_kind", ["date"], indirect=True)
     def test_get_query_date_one_parameter_bad_type():
-        class SomeKind(model.Model):
-            prop1 = model.DateProperty()
-
         gql = gql_module.GQL("SELECT prop1 FROM SomeKind WHERE prop1 = Date(42)")
         with pytest.raises(exceptions.BadQueryError):
             gql.get_query()
 
     @staticmethod
-    @pytest.mark.usefixtures("in_context")
+    @pytest.mark.usefixtures("in_context", "some_kind")
+    @pytest.mark.parametrize("some_kind", ["date"], indirect=True)
     def test_get_query_date_too_many_values():
-        class SomeKind(model.Model):
-            prop1 = model.DateProperty()
-
         gql = gql_module.GQL(
             "SELECT prop1 FROM SomeKind WHERE prop1 = Date(1, 2, 3, 4)"
         )
@@ -422,11 +607,9 @@ class TestGQL:
             gql.get_query()
 
     @staticmethod
-    @pytest.mark.usefixtures("in_context")
+    @pytest.mark.usefixtures("in_context", "some_kind")
+    @pytest.mark.parametrize("some_kind", ["date"], indirect=True)
     def test_get_query_date_bad_values():
-        class SomeKind(model.Model):
-            prop1 = model.DateProperty()
-
         gql = gql_module.GQL(
             "SELECT prop1 FROM SomeKind WHERE prop1 = Date(100, 200, 300)"
         )
@@ -434,11 +617,9 @@ class TestGQL:
             gql.get_query()
 
     @staticmethod
-    @pytest.mark.usefixtures("in_context")
+    @pytest.mark.usefixtures("in_context", "some_kind")
+    @pytest.mark.parametrize("some_kind", ["datetime"], indirect=True)
     def test_get_query_datetime():
-        class SomeKind(model.Model):
-            prop1 = model.DateTimeProperty()
-
         gql = gql_module.GQL(
             "SELECT prop1 FROM SomeKind WHERE prop1 = DateTime(2020, 3, 26,"
             "12, 45, 5)"
@@ -449,11 +630,9 @@ class TestGQL:
         )
 
     @staticmethod
-    @pytest.mark.usefixtures("in_context")
+    @pytest.mark.usefixtures("in_context", "some_kind")
+    @pytest.mark.parametrize("some_kind", ["datetime"], indirect=True)
     def test_get_query_datetime_ome_parameter():
-        class SomeKind(model.Model):
-            prop1 = model.DateTimeProperty()
-
         gql = gql_module.GQL(
             "SELECT prop1 FROM SomeKind WHERE prop1 = "
             "DateTime('2020-03-26 12:45:05')"
@@ -464,43 +643,38 @@ class TestGQL:
         )
 
     @staticmethod
-    @pytest.mark.usefixtures("in_context")
+    @pytest.mark.usefixtures("in_context", "some_kind")
+    @pytest.mark.parametrize("some_kind", ["datetime"], indirect=True)
     def test_get_query_datetime_parameterized():
-        class SomeKind(model.Model):
-            prop1 = model.DateTimeProperty()
-
         gql = gql_module.GQL("SELECT prop1 FROM SomeKind WHERE prop1 = DateTime(:1)")
         query = gql.get_query()
         assert "'datetime'" in str(query.filters)
 
     @staticmethod
-    @pytest.mark.usefixtures("in_context")
+    @pytest.mark.usefixtures("in_context", "some_kind")
+    @pytest.mark.parametrize("some_kind", ["datetime"], indirect=True)
     def test_get_query_datetime_one_parameter_bad_date():
-        class SomeKind(model.Model):
-            prop1 = model.DateTimeProperty()
-
         gql = gql_module.GQL(
             "SELECT prop1 FROM SomeKind WHERE prop1 = DateTime('not a date')"
         )
-        with pytest.raises(exceptions.BadQueryError):
+        with pytest.raises(exceptions.BadQueryError) as error:
             gql.get_query()
+        assert str(error.value).startswith(
+            "GQL function error: Error during date conversion, "
+        )
 
     @staticmethod
-    @pytest.mark.usefixtures("in_context")
+    @pytest.mark.usefixtures("in_context", "some_kind")
+    @pytest.mark.parametrize("some_kind", ["datetime"], indirect=True)
     def test_get_query_datetime_one_parameter_bad_type():
-        class SomeKind(model.Model):
-            prop1 = model.DateTimeProperty()
-
         gql = gql_module.GQL("SELECT prop1 FROM SomeKind WHERE prop1 = DateTime(42)")
         with pytest.raises(exceptions.BadQueryError):
             gql.get_query()
 
     @staticmethod
-    @pytest.mark.usefixtures("in_context")
+    @pytest.mark.usefixtures("in_context", "some_kind")
+    @pytest.mark.parametrize("some_kind", ["datetime"], indirect=True)
     def test_get_query_datetime_bad_values():
-        class SomeKind(model.Model):
-            prop1 = model.DateTimeProperty()
-
         gql = gql_module.GQL(
             "SELECT prop1 FROM SomeKind WHERE prop1 = DateTime(100, 200, 300)"
         )
@@ -508,11 +682,9 @@ class TestGQL:
             gql.get_query()
 
     @staticmethod
-    @pytest.mark.usefixtures("in_context")
+    @pytest.mark.usefixtures("in_context", "some_kind")
+    @pytest.mark.parametrize("some_kind", ["time"], indirect=True)
     def test_get_query_time():
-        class SomeKind(model.Model):
-            prop1 = model.TimeProperty()
-
         gql = gql_module.GQL("SELECT prop1 FROM SomeKind WHERE prop1 = Time(12, 45, 5)")
         query = gql.get_query()
         assert query.filters == query_module.FilterNode(
@@ -520,11 +692,9 @@ class TestGQL:
         )
 
     @staticmethod
-    @pytest.mark.usefixtures("in_context")
+    @pytest.mark.usefixtures("in_context", "some_kind")
+    @pytest.mark.parametrize("some_kind", ["time"], indirect=True)
     def test_get_query_time_one_parameter():
-        class SomeKind(model.Model):
-            prop1 = model.TimeProperty()
-
         gql = gql_module.GQL(
             "SELECT prop1 FROM SomeKind WHERE prop1 = Time('12:45:05')"
         )
@@ -534,11 +704,9 @@ class TestGQL:
         )
 
     @staticmethod
-    @pytest.mark.usefixtures("in_context")
+    @pytest.mark.usefixtures("in_context", "some_kind")
+    @pytest.mark.parametrize("some_kind", ["time"], indirect=True)
     def test_get_query_time_one_parameter_int():
-        class SomeKind(model.Model):
-            prop1 = model.TimeProperty()
-
         gql = gql_module.GQL("SELECT prop1 FROM SomeKind WHERE prop1 = Time(12)")
         query = gql.get_query()
         assert query.filters == query_module.FilterNode(
@@ -546,21 +714,17 @@ class TestGQL:
         )
 
     @staticmethod
-    @pytest.mark.usefixtures("in_context")
+    @pytest.mark.usefixtures("in_context", "some_kind")
+    @pytest.mark.parametrize("some_kind", ["time"], indirect=True)
     def test_get_query_time_parameterized():
-        class SomeKind(model.Model):
-            prop1 = model.TimeProperty()
-
         gql = gql_module.GQL("SELECT prop1 FROM SomeKind WHERE prop1 = Time(:1)")
         query = gql.get_query()
         assert "'time'" in str(query.filters)
 
     @staticmethod
-    @pytest.mark.usefixtures("in_context")
+    @pytest.mark.usefixtures("in_context", "some_kind")
+    @pytest.mark.parametrize("some_kind", ["time"], indirect=True)
     def test_get_query_time_one_parameter_bad_time():
-        class SomeKind(model.Model):
-            prop1 = model.TimeProperty()
-
         gql = gql_module.GQL(
             "SELECT prop1 FROM SomeKind WHERE prop1 = Time('not a time')"
         )
@@ -568,21 +732,17 @@ class TestGQL:
             gql.get_query()
 
     @staticmethod
-    @pytest.mark.usefixtures("in_context")
+    @pytest.mark.usefixtures("in_context", "some_kind")
+    @pytest.mark.parametrize("some_kind", ["time"], indirect=True)
     def test_get_query_time_one_parameter_bad_type():
-        class SomeKind(model.Model):
-            prop1 = model.TimeProperty()
-
         gql = gql_module.GQL("SELECT prop1 FROM SomeKind WHERE prop1 = Time(3.141592)")
         with pytest.raises(exceptions.BadQueryError):
             gql.get_query()
 
     @staticmethod
-    @pytest.mark.usefixtures("in_context")
+    @pytest.mark.usefixtures("in_context", "some_kind")
+    @pytest.mark.parametrize("some_kind", ["time"], indirect=True)
     def test_get_query_time_too_many_values():
-        class SomeKind(model.Model):
-            prop1 = model.TimeProperty()
-
         gql = gql_module.GQL(
             "SELECT prop1 FROM SomeKind WHERE prop1 = Time(1, 2, 3, 4)"
         )
@@ -590,11 +750,9 @@ class TestGQL:
             gql.get_query()
 
     @staticmethod
-    @pytest.mark.usefixtures("in_context")
+    @pytest.mark.usefixtures("in_context", "some_kind")
+    @pytest.mark.parametrize("some_kind", ["time"], indirect=True)
     def test_get_query_time_bad_values():
-        class SomeKind(model.Model):
-            prop1 = model.TimeProperty()
-
         gql = gql_module.GQL(
             "SELECT prop1 FROM SomeKind WHERE prop1 = Time(100, 200, 300)"
         )
@@ -602,11 +760,9 @@ class TestGQL:
             gql.get_query()
 
     @staticmethod
-    @pytest.mark.usefixtures("in_context")
+    @pytest.mark.usefixtures("in_context", "some_kind")
+    @pytest.mark.parametrize("some_kind", ["geopt"], indirect=True)
     def test_get_query_geopt():
-        class SomeKind(model.Model):
-            prop1 = model.GeoPtProperty()
-
         gql = gql_module.GQL(
             "SELECT prop1 FROM SomeKind WHERE prop1 = GeoPt(20.67, -100.32)"
         )
@@ -616,21 +772,17 @@ class TestGQL:
         )
 
     @staticmethod
-    @pytest.mark.usefixtures("in_context")
+    @pytest.mark.usefixtures("in_context", "some_kind")
+    @pytest.mark.parametrize("some_kind", ["geopt"], indirect=True)
     def test_get_query_geopt_parameterized():
-        class SomeKind(model.Model):
-            prop1 = model.GeoPtProperty()
-
         gql = gql_module.GQL("SELECT prop1 FROM SomeKind WHERE prop1 = GeoPt(:1)")
         query = gql.get_query()
         assert "'geopt'" in str(query.filters)
 
     @staticmethod
-    @pytest.mark.usefixtures("in_context")
+    @pytest.mark.usefixtures("in_context", "some_kind")
+    @pytest.mark.parametrize("some_kind", ["geopt"], indirect=True)
     def test_get_query_geopt_too_many_values():
-        class SomeKind(model.Model):
-            prop1 = model.GeoPtProperty()
-
         gql = gql_module.GQL(
             "SELECT prop1 FROM SomeKind WHERE prop1 = " "GeoPt(20.67,-100.32, 1.5)"
         )
@@ -638,11 +790,9 @@ class TestGQL:
             gql.get_query()
 
     @staticmethod
-    @pytest.mark.usefixtures("in_context")
+    @pytest.mark.usefixtures("in_context", "some_kind")
+    @pytest.mark.parametrize("some_kind", ["key"], indirect=True)
     def test_get_query_key():
-        class SomeKind(model.Model):
-            prop1 = model.KeyProperty()
-
         gql = gql_module.GQL(
             "SELECT prop1 FROM SomeKind WHERE prop1 = Key('parent', 'c', "
             "'child', 42)"
@@ -653,21 +803,17 @@ class TestGQL:
         )
 
     @staticmethod
-    @pytest.mark.usefixtures("in_context")
+    @pytest.mark.usefixtures("in_context", "some_kind")
+    @pytest.mark.parametrize("some_kind", ["key"], indirect=True)
     def test_get_query_key_parameterized():
-        class SomeKind(model.Model):
-            prop1 = model.KeyProperty()
-
         gql = gql_module.GQL("SELECT prop1 FROM SomeKind WHERE prop1 = Key(:1)")
         query = gql.get_query()
         assert "'key'" in str(query.filters)
 
     @staticmethod
-    @pytest.mark.usefixtures("in_context")
+    @pytest.mark.usefixtures("in_context", "some_kind")
+    @pytest.mark.parametrize("some_kind", ["key"], indirect=True)
     def test_get_query_key_odd_values():
-        class SomeKind(model.Model):
-            prop1 = model.KeyProperty()
-
         gql = gql_module.GQL(
             "SELECT prop1 FROM SomeKind WHERE prop1 = Key(100, 200, 300)"
         )